@@ -8,8 +8,11 @@ Original date:   December 17, 2016
 Copyright (c) 2019 David Banas; all rights reserved World wide.
 """
 import re
+import sys
+from copy import deepcopy
+from functools import lru_cache
 
-from parsec import ParseError, generate, many, many1, regex, string, parsecmap
+from parsec import ParseError, Parser, Value, generate, many, many1, string, parsecmap
 from traits.api import Bool, Enum, HasTraits, Range, Trait, List
 from traitsui.api import Group, Item, View
 from traitsui.menu import ModalButtons
@@ -82,12 +85,15 @@ class AMIParamConfigurator(HasTraits):
         gui_items, new_traits = make_gui_items(
             "Model Specific In/InOut Parameters", param_dict["Model_Specific"], first_call=True
         )
-        trait_names = []
-        for trait in new_traits:
-            self.add_trait(trait[0], trait[1])
-            trait_names.append(trait[0])
+        # Nobody's listening yet; so, skip the per-trait change notifications.
+        self._trait_change_notify(False)
+        try:
+            for (trait_name, trait) in new_traits:
+                self.add_trait(trait_name, trait)
+        finally:
+            self._trait_change_notify(True)
         self._content = gui_items
-        self._param_trait_names = trait_names
+        self._param_trait_names = [trait_name for (trait_name, _) in new_traits]
         self._root_name = top_branch[0]
         self._ami_parsing_errors = err_str
         self._content = gui_items
@@ -176,9 +182,28 @@ class AMIParamConfigurator(HasTraits):
 # AMI file parser.
 #####
 
+
+def compiled_regex(exp, flags=0):
+    """Parse according to a regular expression, compiled once, up front.
+
+    A leaner version of ``parsec.regex()``, which skips the per-call
+    input type check and calls the compiled pattern's ``match()`` directly.
+    """
+    match = re.compile(exp, flags).match
+
+    @Parser
+    def fn(text, index):
+        res = match(text, index)
+        if res:
+            return Value.success(res.end(), res.group(0))
+        return Value.failure(index, exp)
+
+    return fn
+
+
 # ignore cases.
-whitespace = regex(r"\s+", re.MULTILINE)
-comment = regex(r"\|.*")
+whitespace = compiled_regex(r"\s+", re.MULTILINE)
+comment = compiled_regex(r"\|.*")
 ignore = many((whitespace | comment))
 
 
@@ -197,14 +222,14 @@ def int2tap(x):
 
 lparen = lexeme(string("("))
 rparen = lexeme(string(")"))
-number = lexeme(regex(r"[-+]?[0-9]*\.?[0-9]+([eE][-+]?[0-9]+)?"))
-integ  = lexeme(regex(r"[-+]?[0-9]+"))
-nat    = lexeme(regex(r"[0-9]+"))
+number = lexeme(compiled_regex(r"[-+]?[0-9]*\.?[0-9]+([eE][-+]?[0-9]+)?"))
+integ  = lexeme(compiled_regex(r"[-+]?[0-9]+"))
+nat    = lexeme(compiled_regex(r"[0-9]+"))
 tap_ix = integ.parsecmap(int2tap)
-symbol = lexeme(regex(r"[a-zA-Z_][^\s()]*"))
+symbol = lexeme(compiled_regex(r"[a-zA-Z_][^\s()]*"))
 true = lexeme(string("True")).result(True)
 false = lexeme(string("False")).result(False)
-ami_string = lexeme(regex(r'"[^"]*"'))
+ami_string = lexeme(compiled_regex(r'"[^"]*"'))
 
 atom = number | symbol | ami_string | (true | false)
 node_name = symbol | tap_ix  # `tap_ix` is new and gives the tap position; negative positions are allowed.
@@ -214,13 +239,15 @@ def node():
     "Parse AMI node."
     yield lparen
     label = yield node_name
-    values = yield many1(expr)
+    values = yield node_values
     yield rparen
     return (label, values)
 
 
 expr = atom | node
-ami_defs = ignore >> node
+node_values = many1(expr)  # Built once, here, rather than on every ``node`` invocation.
+AMI_PARAM_DEFS_PARSER = ignore >> node
+ami_defs = AMI_PARAM_DEFS_PARSER  # Retained for backward compatibility.
 
 
 def proc_branch(branch):
@@ -261,7 +288,7 @@ def proc_branch(branch):
             err_str = "ERROR: Malformed item: {}\n".format(branch[0])
         results = (err_str, {})
 
-    param_name = branch[0]
+    param_name = sys.intern(branch[0])  # Parsed names aren't interned automatically.
     param_tags = branch[1]
 
     if not param_tags:
@@ -303,6 +330,10 @@ def parse_ami_param_defs(param_str):
     """
     Parse the contents of a IBIS-AMI parameter definition file.
 
+    Results are memoized on ``param_str``, so repeated parsing of the
+    same file contents costs only a dictionary lookup (plus a copy).
+    Use ``parse_ami_param_defs.cache_clear()`` to flush the memo.
+
     Args:
         param_str (str): The contents of the file, as a single string.
 
@@ -345,8 +376,15 @@ def parse_ami_param_defs(param_str):
                     - sub-dictionaries following the same pattern.
 
     """
+    # Hand out a private copy, so that callers can't corrupt the cache.
+    return deepcopy(_parse_ami_param_defs(param_str))
+
+
+@lru_cache(maxsize=64)
+def _parse_ami_param_defs(param_str):
+    "Memoized implementation of ``parse_ami_param_defs()``."
     try:
-        res = ami_defs.parse(param_str)
+        res = AMI_PARAM_DEFS_PARSER.parse(param_str)
     except ParseError as pe:
         err_str = "Expected {} at {} in:\n{}".format(pe.expected, pe.loc(), pe.text[pe.index :])
         return err_str, {}
@@ -402,6 +440,10 @@ def parse_ami_param_defs(param_str):
     return (err_str, param_dict)
 
 
+parse_ami_param_defs.cache_clear = _parse_ami_param_defs.cache_clear
+parse_ami_param_defs.cache_info = _parse_ami_param_defs.cache_info
+
+
 def make_gui_items(pname, param, first_call=False):
     """Builds list of GUI items from AMI parameter dictionary."""
 
@@ -422,12 +464,11 @@ def make_gui_items(pname, param, first_call=False):
                     list_tips = param.plist_tip
                     default = param.pdefault
                     if list_tips:
-                        tmp_dict = {}
-                        tmp_dict.update(list(zip(list_tips, param.pvalue)))
-                        val = list(tmp_dict.keys())[0]
+                        tmp_dict = dict(zip(list_tips, param.pvalue))
+                        val = next(iter(tmp_dict))
                         if default:
-                            for tip in tmp_dict:
-                                if tmp_dict[tip] == default:
+                            for tip, pval in tmp_dict.items():
+                                if pval == default:
                                     val = tip
                                     break
                         new_traits.append((pname, Trait(val, tmp_dict)))
@@ -441,28 +482,24 @@ def make_gui_items(pname, param, first_call=False):
                     new_traits.append((pname, param.pvalue))
                     gui_items.append(Item(pname, style="readonly", tooltip=param.pdescription))
     else:  # subparameter branch
-        subparam_names = list(param.keys())
-        subparam_names.sort()
-        sub_items = []
         group_desc = ""
 
-        # Build GUI items for this branch.
-        for subparam_name in subparam_names:
-            if subparam_name == "description":
-                group_desc = param[subparam_name]
-            else:
-                tmp_items, tmp_traits = make_gui_items(subparam_name, param[subparam_name])
-                sub_items.extend(tmp_items)
-                new_traits.extend(tmp_traits)
-
-        # Put all top-level ungrouped parameters in a single VGroup.
+        # Build GUI items for this branch, putting all top-level ungrouped
+        # parameters (i.e. - the ``Item``s built from ``AMIParameter``s)
+        # in a single VGroup, as we go.
         top_lvl_params = []
         sub_params = []
-        for item in sub_items:
-            if isinstance(item, Item):
-                top_lvl_params.append(item)
+        for subparam_name in sorted(param):
+            subparam = param[subparam_name]
+            if subparam_name == "description":
+                group_desc = subparam
             else:
-                sub_params.append(item)
+                tmp_items, tmp_traits = make_gui_items(subparam_name, subparam)
+                if isinstance(subparam, AMIParameter):
+                    top_lvl_params.extend(tmp_items)
+                else:
+                    sub_params.extend(tmp_items)
+                new_traits.extend(tmp_traits)
         sub_items = [Group(top_lvl_params)] + sub_params
 
         # Make the top-level group an HGroup; all others VGroups (default).
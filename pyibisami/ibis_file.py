@@ -16,9 +16,13 @@ Copyright (c) 2019 by David Banas; All rights reserved World wide.
 """
 
 import platform
+import sys
 
+from collections  import deque
 from datetime     import datetime
-from traits.api   import HasTraits, Trait, String, Float, List, Property, cached_property, Dict, Any, Enum
+from pathlib      import Path
+from time         import time
+from traits.api   import HasTraits, Trait, String, Float, List, Enum
 from traitsui.api import Item, View, ModalButtons, Group, spring, VGroup, HGroup
 from chaco.api    import ArrayPlotData, Plot
 from enable.component_editor import ComponentEditor
@@ -27,6 +31,20 @@ from traitsui.message import message
 from pyibisami.ibis_parser import parse_ibis_file
 from pyibisami.ibis_model  import Model
 
+# These are process invariant; so, query them only once.
+# (``sys.maxsize`` avoids ``platform.architecture()``, which may probe the interpreter binary.)
+_OS_TYPE = platform.system()
+_OS_BITS = '64bit' if sys.maxsize > 2**32 else '32bit'
+_HOST_KEY = ('windows' if _OS_TYPE.lower() == 'windows' else 'linux',  # Our key into ``Model._execs``.
+             64 if _OS_BITS == '64bit' else 32)
+
+_LOG_MAX_ENTRIES = 2048  # Only the most recent log entries are retained.
+
+def _format_log_entry(entry):
+    "Render a ``(timestamp, message)`` log entry as text."
+    (timestamp, msg) = entry
+    return "\n[{}]: {}\n".format(datetime.fromtimestamp(timestamp), msg)
+
 class IBISModel(HasTraits):
     """
     HasTraits subclass for wrapping and interacting with an IBIS model.
@@ -59,36 +77,37 @@ class IBISModel(HasTraits):
     via the ``model_dict`` property.
     """
 
-    _log = ""
-
-    pin_     = Property(Any,  depends_on=["pin"])
-    pin_rlcs = Property(Dict, depends_on=["pin"])
-    model    = Property(Any,  depends_on=["mod"])
     pins   = List  # Always holds the list of valid pin selections, given a component selection.
     models = List  # Always holds the list of valid model selections, given a pin selection.
+    ibis_ver  = Float
+    file_name = String
+    file_rev  = String
+    date      = String("(n/a)")
 
     def get_models(self, mname):
         """Return the list of models associated with a particular name."""
-        model_dict = self._model_dict
-        if 'model_selectors' in model_dict and mname in model_dict['model_selectors']:
-            return list(map(lambda pr: pr[0], model_dict['model_selectors'][mname]))
-        else:
-            return [mname]
+        models_cache = self._models_cache
+        if mname not in models_cache:
+            model_dict = self._model_dict
+            if 'model_selectors' in model_dict and mname in model_dict['model_selectors']:
+                models_cache[mname] = tuple(pr[0] for pr in model_dict['model_selectors'][mname])
+            else:
+                models_cache[mname] = (mname,)
+        return list(models_cache[mname])  # A fresh list, so callers can't corrupt the cache.
 
     def get_pins(self):
         """Get the list of appropriate pins, given our type (i.e. - Tx or Rx)."""
-        pins = self.comp_.pins
-        def pin_ok(pname):
-            (mname, _) = pins[pname]
-            mods = self.get_models(mname)
-            mod = self._models[mods[0]]
-            mod_type = mod.mtype.lower()
-            tx_ok = (mod_type == "output") or (mod_type == "i/o")
-            if self._is_tx:
-                return(tx_ok)
-            else:
-                return(not tx_ok)
-        return(list(filter(pin_ok, list(pins))))
+        pin_is_tx = self._pin_is_tx.get(self.comp)
+        if pin_is_tx is None:  # Classify each component's pins only once, and only if it gets selected.
+            models = self._models
+            get_models = self.get_models
+            def is_tx_model(mname):
+                mtype = models[get_models(mname)[0]].mtype.lower()
+                return (mtype == "output") or (mtype == "i/o")
+            pin_is_tx = {pname: is_tx_model(mname) for pname, (mname, _) in self.comp_.pins.items()}
+            self._pin_is_tx[self.comp] = pin_is_tx
+        is_tx = self._is_tx
+        return [pname for pname, tx_ok in pin_is_tx.items() if tx_ok == is_tx]
 
     def __init__(self, ibis_file_name, is_tx, debug=False):
         """
@@ -106,12 +125,12 @@ class IBISModel(HasTraits):
         # to get all the Traits/UI machinery setup correctly.
         super(IBISModel, self).__init__()
 
+        self._log = deque(maxlen=_LOG_MAX_ENTRIES)  # (timestamp, message) pairs; formatted by ``log_txt``.
         self.debug = debug
         self.log("pyibisami.ibis_file.IBISModel initializing...")
 
         # Parse the IBIS file contents, storing any errors or warnings, and validate it.
-        with open(ibis_file_name) as file:
-            ibis_file_contents_str = file.read()
+        ibis_file_contents_str = Path(ibis_file_name).read_text()
         err_str, model_dict = parse_ibis_file(ibis_file_contents_str, debug=debug)
         if 'components' not in model_dict or not model_dict['components']:
             raise ValueError("This IBIS model has no components! Parser messages:\n" + err_str)
@@ -121,30 +140,30 @@ class IBISModel(HasTraits):
         models = model_dict['models']
         self._model_dict = model_dict
         self._models = models
+        self._models_cache = {}  # ``get_models()`` results, as tuples, by model/selector name.
+        self._cache = {}  # ``pin_``, ``pin_rlcs``, and ``model``; invalidated by the ``_*_changed()`` handlers.
+        self._pin_is_tx = {}  # Tx (True) / Rx (False) classification of each pin, by component; filled by ``get_pins()``.
         self._is_tx = is_tx
         self.log("IBIS parsing errors/warnings:\n" + err_str)
 
         # Add Traits for various attributes found in the IBIS file.
-        self.add_trait('comp', Trait(list(components)[0], components))  # Doesn't need a custom mapper, because
-        self.pins = self.get_pins()                                     # the thing above it (file) can't change.
+        first_comp = next(iter(components))
+        self.add_trait('comp', Trait(first_comp, components))  # Doesn't need a custom mapper, because
+        self.pins = self.get_pins()                            # the thing above it (file) can't change.
         self.add_trait('pin', Enum(self.pins[0], values="pins"))
         (mname, rlc_dict) = self.pin_
         self.models = self.get_models(mname)
         self.add_trait('mod',       Enum(self.models[0], values="models"))
-        self.add_trait('ibis_ver',  Float(model_dict['ibis_ver']))
-        self.add_trait('file_name', String(model_dict['file_name']))
-        self.add_trait('file_rev',  String(model_dict['file_rev']))
-        if 'date' in model_dict:
-            self.add_trait('date',      String(model_dict['date']))
-        else:
-            self.add_trait('date',      String("(n/a)"))
+        self.trait_setq(
+            ibis_ver=model_dict['ibis_ver'],
+            file_name=model_dict['file_name'],
+            file_rev=model_dict['file_rev'],
+            date=model_dict.get('date', "(n/a)"),
+        )
 
         self._ibis_parsing_errors = err_str
-        self._os_type = platform.system()           # These 2 are used, to choose
-        self._os_bits = platform.architecture()[0]  # the correct AMI executable.
 
-        self._comp_changed(list(components)[0])     # Wasn't being called automatically.
-        self._pin_changed(self.pins[0])             # Wasn't being called automatically.
+        self._comp_changed(first_comp)              # Wasn't being called automatically.
 
         self.log("Done.")
 
@@ -152,27 +171,39 @@ class IBISModel(HasTraits):
         return(f"IBIS Model '{self._model_dict['file_name']}'")
 
     def info(self):
-        res = ""
+        """Summary of the IBIS file contents, as a single string."""
+        return "".join(self._iter_info())
+
+    def _iter_info(self):
+        "Yield the sections of ``info()``, in order, building each only on demand."
+        yield self.info_header()
+        yield self.info_components()
+        yield self.info_selectors()
+        yield self.info_models()
+
+    def info_header(self):
+        """IBIS version, file name/revision, and date."""
+        model_dict = self._model_dict
         try:
-            for k in ['ibis_ver', 'file_name', 'file_rev']:
-                res += k + ':\t' + str(self._model_dict[k]) + '\n'
+            header = "".join(f"{k}:\t{model_dict[k]}\n" for k in ['ibis_ver', 'file_name', 'file_rev'])
         except:
-            print(self._model_dict)
+            print(model_dict)
             raise
-        res += 'date' + ':\t\t' + str(self._model_dict['date']) + '\n'
-        res += "\nComponents:"
-        res += "\n=========="
-        for c in list(self._model_dict['components']):
-            res += "\n" + c + ":\n" + "---\n" + str(self._model_dict['components'][c]) + "\n"
-        res += "\nModel Selectors:"
-        res += "\n===============\n"
-        for s in list(self._model_dict['model_selectors']):
-            res += f"{s}\n"
-        res += "\nModels:"
-        res += "\n======"
-        for m in list(self._model_dict['models']):
-            res += "\n" + m + ":\n" + "---\n" + str(self._model_dict['models'][m])
-        return res
+        return header + f"date:\t\t{model_dict['date']}\n"
+
+    def info_components(self):
+        """Listing of all components."""
+        components = self._model_dict['components']
+        return "\nComponents:\n==========" + "".join(f"\n{c}:\n---\n{comp}\n" for c, comp in components.items())
+
+    def info_selectors(self):
+        """Listing of all model selector names."""
+        return "\nModel Selectors:\n===============\n" + "".join(f"{s}\n" for s in self._model_dict['model_selectors'])
+
+    def info_models(self):
+        """Listing of all models."""
+        models = self._model_dict['models']
+        return "\nModels:\n======" + "".join(f"\n{m}:\n---\n{model}" for m, model in models.items())
 
     def __call__(self):
         """Present a customized GUI to the user, for model selection, etc."""
@@ -182,10 +213,10 @@ class IBISModel(HasTraits):
     def log(self, msg, alert=False):
         """Log a message to the console and, optionally, to terminal and/or pop-up dialog."""
         _msg = msg.strip()
-        txt = "\n[{}]: {}\n".format(datetime.now(), _msg)
-        self._log += txt
+        entry = (time(), _msg)
+        self._log.append(entry)
         if self.debug:
-            print(txt)
+            print(_format_log_entry(entry))
         if alert:
             message(_msg, "PyAMI Alert")
 
@@ -215,18 +246,29 @@ class IBISModel(HasTraits):
         )
         return view
 
-    @cached_property
-    def _get_pin_(self):
-        return self.comp_.pins[self.pin]
+    @property
+    def pin_(self):
+        """The (model name, RLC dictionary) pair for the selected pin."""
+        cache = self._cache
+        if 'pin_' not in cache:
+            cache['pin_'] = self.comp_.pins[self.pin]
+        return cache['pin_']
 
-    @cached_property
-    def _get_pin_rlcs(self):
-        (_, pin_rlcs) = self.pin_
-        return pin_rlcs
+    @property
+    def pin_rlcs(self):
+        """The package RLC values for the selected pin."""
+        cache = self._cache
+        if 'pin_rlcs' not in cache:
+            (_, cache['pin_rlcs']) = self.pin_
+        return cache['pin_rlcs']
 
-    @cached_property
-    def _get_model(self):
-        return self._models[self.mod]
+    @property
+    def model(self):
+        """The selected model."""
+        cache = self._cache
+        if 'model' not in cache:
+            cache['model'] = self._models[self.mod]
+        return cache['model']
 
     @property
     def ibis_parsing_errors(self):
@@ -235,8 +277,8 @@ class IBISModel(HasTraits):
 
     @property
     def log_txt(self):
-        """The complete log since instantiation."""
-        return self._log
+        """The log since instantiation (limited to the most recent ``_LOG_MAX_ENTRIES`` entries)."""
+        return "".join(map(_format_log_entry, self._log))
 
     @property
     def model_dict(self):
@@ -251,37 +293,35 @@ class IBISModel(HasTraits):
     def ami_file(self):
         return self._ami_file
 
+    def _set_pin(self, pin_name):
+        """Refresh everything that depends upon the pin selection, in one pass."""
+        cache = self._cache
+        cache.pop('model', None)
+        cache['pin_'] = (mname, rlc_dict) = self.comp_.pins[pin_name]
+        cache['pin_rlcs'] = rlc_dict
+        models = self.get_models(mname)
+        if models != self.models:  # Avoid firing needless change notifications.
+            self.models = models
+        self.mod = self.models[0]
+
     def _comp_changed(self, new_value):
-        self.pins = self.get_pins()
-        self.pin = self.pins[0]
+        pins = self.get_pins()
+        if pins != self.pins:  # Avoid firing needless change notifications.
+            self.pins = pins
+        if self.pin == self.pins[0]:  # No change notification coming; so, refresh explicitly.
+            self._set_pin(self.pin)
+        else:
+            self.pin = self.pins[0]  # ``_pin_changed()`` takes it from here.
 
     def _pin_changed(self, new_value):
-        model_dict = self._model_dict
-        # (mname, rlc_dict) = self.pin_  # Doesn't work. Because ``pin_`` is a cached property and hasn't yet been marked "dirty"?
-        (mname, rlc_dict) = self.comp_.pins[new_value]
-        self.models = self.get_models(mname)
-        self.mod = self.models[0]
+        self._set_pin(new_value)
 
     def _mod_changed(self, new_value):
+        self._cache.pop('model', None)
         model = self._models[new_value]
-        os_type = self._os_type
-        os_bits = self._os_bits
-        fnames = []
-        dll_file = ""
-        ami_file = ""
-        if os_type.lower() == 'windows':
-            if os_bits == '64bit':
-                fnames = model._exec64Wins
-            else:
-                fnames = model._exec32Wins
-        else:
-            if os_bits == '64bit':
-                fnames = model._exec64Lins
-            else:
-                fnames = model._exec32Lins
+        fnames = model._execs.get(_HOST_KEY)
+        dll_file, ami_file = fnames[:2] if fnames else ("", "")
         if fnames:
-            dll_file = fnames[0]
-            ami_file = fnames[1]
             self.log(
                 "There was an [Algorithmic Model] keyword in this model.\n \
 If you wish to use the AMI model associated with this IBIS model,\n \
@@ -289,7 +329,7 @@ please, go the 'Equalization' tab and enable it now.",
                 alert=True)
         elif 'algorithmic_model' in model._subDict:
             self.log(f"There was an [Algorithmic Model] keyword for this model,\n \
-but no executable for your platform: {os_type}-{os_bits};\n \
+but no executable for your platform: {_OS_TYPE}-{_OS_BITS};\n \
 PyBERT native equalization modeling being used instead.",
                 alert=True)
         else:
@@ -13,7 +13,7 @@ Copyright (c) 2019 by David Banas; All rights reserved World wide.
 
 import numpy      as np
 
-from traits.api   import HasTraits, Trait, String, Float, List
+from traits.api   import HasTraits, Trait, String, Float, List, Property
 from traitsui.api import Item, View, ModalButtons, Group, spring
 from chaco.api    import ArrayPlotData, Plot
 from enable.component_editor import ComponentEditor
@@ -38,12 +38,10 @@ class Component(HasTraits):
         self._subDict = subDict
 
         # Fetch available keyword/parameter definitions.
-        def maybe(name):
-            return subDict[name] if name in subDict else None
-        self._mfr   = maybe('manufacturer')
-        self._pkg   = maybe('package')
-        self._pins  = maybe('pin')
-        self._diffs = maybe('diff_pin')
+        self._mfr   = subDict.get('manufacturer')
+        self._pkg   = subDict.get('package')
+        self._pins  = subDict.get('pin')
+        self._diffs = subDict.get('diff_pin')
 
         # Check for the required keywords.
         if not self._mfr:
@@ -57,7 +55,7 @@ class Component(HasTraits):
         # Set up the GUI.
         self.add_trait('manufacturer', String(self._mfr))
         self.add_trait('package',      String(self._pkg))
-        self.add_trait('_pin',         Trait(list(self._pins)[0], self._pins))
+        self.add_trait('_pin',         Trait(next(iter(self._pins)), self._pins))
         self._content = [
             Group(
                 Item('manufacturer', label='Manufacturer', style='readonly'),
@@ -68,12 +66,13 @@ class Component(HasTraits):
         ]
 
     def __str__(self):
-        res  = "Manufacturer:\t" + self._mfr       + '\n'
-        res += "Package:     \t" + str(self._pkg)  + '\n'
-        res += "Pins:\n"
-        for pname in self._pins:
-            res += "    " + pname + ":\t" + str(self._pins[pname]) + '\n'
-        return res
+        lines = [
+            f"Manufacturer:\t{self._mfr}",
+            f"Package:     \t{self._pkg}",
+            "Pins:",
+        ]
+        lines.extend(f"    {pname}:\t{pin}" for (pname, pin) in self._pins.items())
+        return "\n".join(lines) + '\n'
 
     def __call__(self):
         self.edit_traits()
@@ -105,6 +104,10 @@ class Model(HasTraits):
     """Encapsulation of a particular I/O model from an IBIS model file.
     """
 
+    plot_iv = Property()  # Built on first access; see ``_get_plot_iv()``.
+    _plot_iv = None
+    _iv_curves = None
+
     def __init__(self, subDict):
         """
         Args:
@@ -119,17 +122,15 @@ class Model(HasTraits):
         self._subDict = subDict
 
         # Fetch available keyword/parameter definitions.
-        def maybe(name):
-            return subDict[name] if name in subDict else None
-        self._mtype  = maybe('model_type')
-        self._ccomp  = maybe('c_comp')
-        self._cref   = maybe('cref')
-        self._vref   = maybe('vref')
-        self._vmeas  = maybe('vmeas')
-        self._rref   = maybe('rref')
-        self._trange = maybe('temperature_range')
-        self._vrange = maybe('voltage_range')
-        self._ramp   = maybe('ramp')
+        self._mtype  = subDict.get('model_type')
+        self._ccomp  = subDict.get('c_comp')
+        self._cref   = subDict.get('cref')
+        self._vref   = subDict.get('vref')
+        self._vmeas  = subDict.get('vmeas')
+        self._rref   = subDict.get('rref')
+        self._trange = subDict.get('temperature_range')
+        self._vrange = subDict.get('voltage_range')
+        self._ramp   = subDict.get('ramp')
 
         # Check for the required keywords.
         if not self._mtype:
@@ -142,98 +143,45 @@ class Model(HasTraits):
         if mtype == 'output' or mtype == 'i/o':
             if 'pulldown' not in subDict or 'pullup' not in subDict:
                 raise LookupError("Missing I-V curves!")
-            plotdata = ArrayPlotData()
             def proc_iv(xs):
                 if len(xs) < 2:
                     raise ValueError("Insufficient number of I-V data points!")
-                vs, iss = zip(*(xs))  # Idiomatic Python for ``unzip``.
-                ityps, imins, imaxs = zip(*iss)
+                ivs = np.array([(v, ityp, imin, imax) for (v, (ityp, imin, imax)) in xs], dtype=float)
+                vs = ivs[:, 0]
+                if not np.all(np.diff(vs) > 0):  # ``searchsorted()``, below, depends on this.
+                    raise ValueError("I-V data voltages must be strictly ascending!")
                 vmeas = self._vmeas
-                def calcZ(x):
-                    (vs, ivals) = x
-                    if vmeas:
-                        ix = np.where(np.array(vs) >= vmeas)[0][0]
-                    else:
-                        ix = np.where(np.array(vs) >= max(vs)/2)[0][0]
-                    return abs((vs[ix] - vs[ix-1])/(ivals[ix] - ivals[ix-1]))
-                zs = map(calcZ, zip([vs, vs, vs], [ityps, imins, imaxs]))
-                return vs, ityps, imins, imaxs, zs
+                ix = np.searchsorted(vs, vmeas if vmeas else vs[-1]/2)
+                zs = np.abs((vs[ix] - vs[ix-1]) / (ivs[ix, 1:] - ivs[ix-1, 1:]))  # (Ztyp, Zmin, Zmax)
+                return vs, ivs[:, 1], ivs[:, 2], ivs[:, 3], zs
             pd_vs, pd_ityps, pd_imins, pd_imaxs, pd_zs = proc_iv(subDict['pulldown'])
             pu_vs, pu_ityps, pu_imins, pu_imaxs, pu_zs = proc_iv(subDict['pullup'])
-            pu_vs = self._vrange[0] - np.array(pu_vs)  # Correct for Vdd-relative pull-up voltages.
-            pu_ityps = -np.array(pu_ityps)             # Correct for current sense, for nicer plot.
-            pu_imins = -np.array(pu_imins)
-            pu_imaxs = -np.array(pu_imaxs)
-            self._zout = (list(pd_zs)[0] + list(pu_zs)[0])/2
-            plotdata.set_data("pd_vs",    pd_vs)
-            plotdata.set_data("pd_ityps", pd_ityps)
-            plotdata.set_data("pd_imins", pd_imins)
-            plotdata.set_data("pd_imaxs", pd_imaxs)
-            plotdata.set_data("pu_vs",    pu_vs)
-            plotdata.set_data("pu_ityps", pu_ityps)
-            plotdata.set_data("pu_imins", pu_imins)
-            plotdata.set_data("pu_imaxs", pu_imaxs)
-            plot_iv = Plot(plotdata)  # , padding_left=75)
-            # The 'line_style' trait of a LinePlot instance must be 'dash' or 'dot dash' or 'dot' or 'long dash' or 'solid'.
-            plot_iv.plot(("pd_vs", "pd_ityps"), type="line", color="blue", line_style="solid", name="PD-Typ")
-            plot_iv.plot(("pd_vs", "pd_imins"), type="line", color="blue", line_style="dot",   name="PD-Min")
-            plot_iv.plot(("pd_vs", "pd_imaxs"), type="line", color="blue", line_style="dash",  name="PD-Max")
-            plot_iv.plot(("pu_vs", "pu_ityps"), type="line", color="red",  line_style="solid", name="PU-Typ")
-            plot_iv.plot(("pu_vs", "pu_imins"), type="line", color="red",  line_style="dot",   name="PU-Min")
-            plot_iv.plot(("pu_vs", "pu_imaxs"), type="line", color="red",  line_style="dash",  name="PU-Max")
-            plot_iv.title = "Pull-Up/Down I-V Curves"
-            plot_iv.index_axis.title = "Vout (V)"
-            plot_iv.value_axis.title = "Iout (A)"
-            plot_iv.index_range.low_setting  = 0
-            plot_iv.index_range.high_setting = self._vrange[0]
-            plot_iv.value_range.low_setting  = 0
-            plot_iv.value_range.high_setting = 0.1
-            plot_iv.legend.visible = True
-            plot_iv.legend.align = "ul"
-            self.plot_iv = plot_iv
+            pu_vs = self._vrange[0] - pu_vs  # Correct for Vdd-relative pull-up voltages.
+            pu_ityps = -pu_ityps             # Correct for current sense, for nicer plot.
+            pu_imins = -pu_imins
+            pu_imaxs = -pu_imaxs
+            self._zout = float(pd_zs[0] + pu_zs[0])/2
+            self._iv_curves = {  # The I-V plot itself isn't built until the user asks to see it.
+                "pd_vs":    pd_vs,
+                "pd_ityps": pd_ityps,
+                "pd_imins": pd_imins,
+                "pd_imaxs": pd_imaxs,
+                "pu_vs":    pu_vs,
+                "pu_ityps": pu_ityps,
+                "pu_imins": pu_imins,
+                "pu_imaxs": pu_imaxs,
+            }
 
             if not self._ramp:
                 raise LookupError("Missing [Ramp]!")
-            ramp = subDict['ramp']
+            ramp = self._ramp
             self._slew = (ramp['rising'][0] + ramp['falling'][0])/2e9  # (V/ns)
 
-        # Separate AMI executables by OS.
-        def is64(x):
-            ((_, b), _) = x
-            return int(b) == 64
-
-        def isWin(x):
-            ((os, _), _) = x
-            return os.lower() == 'windows'
-
-        def showExec(x):
-            ((os, b), fs) = x
-            return os + str(b) + ': ' + str(fs)
-
-        def partition(p, xs):
-            ts, fs = [], []
-            for x in xs:
-                ts.append(x) if p(x) else fs.append(x)
-            return ts, fs
-
-        def getFiles(x):
-            if x:
-                ((_, _), fs) = x[0]
-                return fs
-            else:
-                return []
-
-        def splitExecs(fs):
-            wins, lins = partition(isWin, fs)
-            return (getFiles(wins), getFiles(lins))
-
-        self._exec32Wins, self._exec32Lins = [], []
-        self._exec64Wins, self._exec64Lins = [], []
-        if 'algorithmic_model' in subDict:
-            execs = subDict['algorithmic_model']
-            exec64s, exec32s = partition(is64, execs)
-            self._exec32Wins, self._exec32Lins = splitExecs(exec32s)
-            self._exec64Wins, self._exec64Lins = splitExecs(exec64s)
+        # Tabulate AMI executables by (OS, bits), in a single pass,
+        # keeping the first one found for each combination.
+        self._execs = {}
+        for ((os, b), fs) in subDict.get('algorithmic_model', []):
+            self._execs.setdefault((os.lower(), int(b)), fs)
 
         # Set up the GUI.
         self.add_trait('model_type', String(self._mtype))
@@ -269,27 +217,26 @@ class Model(HasTraits):
             self._content.append(Item('plot_iv', editor=ComponentEditor(), show_label=False))
 
     def __str__(self):
-        res = "Model Type:\t" + self._mtype + '\n'
-        res += "C_comp:    \t" + str(self._ccomp) + '\n'
-        res += "Cref:      \t" + str(self._cref)  + '\n'
-        res += "Vref:      \t" + str(self._vref)  + '\n'
-        res += "Vmeas:     \t" + str(self._vmeas) + '\n'
-        res += "Rref:      \t" + str(self._rref)  + '\n'
-        res += "Temperature Range:\t" + str(self._trange) + '\n'
-        res += "Voltage Range:    \t" + str(self._vrange) + '\n'
+        lines = [
+            f"Model Type:\t{self._mtype}",
+            f"C_comp:    \t{self._ccomp}",
+            f"Cref:      \t{self._cref}",
+            f"Vref:      \t{self._vref}",
+            f"Vmeas:     \t{self._vmeas}",
+            f"Rref:      \t{self._rref}",
+            f"Temperature Range:\t{self._trange}",
+            f"Voltage Range:    \t{self._vrange}",
+        ]
         if 'algorithmic_model' in self._subDict:
-            res += "Algorithmic Model:\n" \
-                   + "\t32-bit:\n"
-            if self._exec32Lins:
-                res += "\t\tLinux: "   + str(self._exec32Lins) + '\n'
-            if self._exec32Wins:
-                res += "\t\tWindows: " + str(self._exec32Wins) + '\n'
-            res += "\t64-bit:\n"
-            if self._exec64Lins:
-                res += "\t\tLinux: "   + str(self._exec64Lins) + '\n'
-            if self._exec64Wins:
-                res += "\t\tWindows: " + str(self._exec64Wins) + '\n'
-        return res
+            execs = self._execs
+            lines.append("Algorithmic Model:")
+            for bits in (32, 64):
+                lines.append(f"\t{bits}-bit:")
+                if ('linux', bits) in execs:
+                    lines.append(f"\t\tLinux: {execs['linux', bits]}")
+                if ('windows', bits) in execs:
+                    lines.append(f"\t\tWindows: {execs['windows', bits]}")
+        return "\n".join(lines) + '\n'
 
     def __call__(self):
         self.edit_traits(kind='livemodal')
@@ -304,6 +251,32 @@ class Model(HasTraits):
         view.set_content(self._content)
         return view
 
+    def _get_plot_iv(self):
+        # Memoized by hand (rather than via ``@cached_property``), so the plot is built exactly once.
+        if self._plot_iv is None and self._iv_curves is not None:
+            plotdata = ArrayPlotData()
+            for (name, values) in self._iv_curves.items():
+                plotdata.set_data(name, values)
+            plot_iv = Plot(plotdata)  # , padding_left=75)
+            # The 'line_style' trait of a LinePlot instance must be 'dash' or 'dot dash' or 'dot' or 'long dash' or 'solid'.
+            plot_iv.plot(("pd_vs", "pd_ityps"), type="line", color="blue", line_style="solid", name="PD-Typ")
+            plot_iv.plot(("pd_vs", "pd_imins"), type="line", color="blue", line_style="dot",   name="PD-Min")
+            plot_iv.plot(("pd_vs", "pd_imaxs"), type="line", color="blue", line_style="dash",  name="PD-Max")
+            plot_iv.plot(("pu_vs", "pu_ityps"), type="line", color="red",  line_style="solid", name="PU-Typ")
+            plot_iv.plot(("pu_vs", "pu_imins"), type="line", color="red",  line_style="dot",   name="PU-Min")
+            plot_iv.plot(("pu_vs", "pu_imaxs"), type="line", color="red",  line_style="dash",  name="PU-Max")
+            plot_iv.title = "Pull-Up/Down I-V Curves"
+            plot_iv.index_axis.title = "Vout (V)"
+            plot_iv.value_axis.title = "Iout (A)"
+            plot_iv.index_range.low_setting  = 0
+            plot_iv.index_range.high_setting = self._vrange[0]
+            plot_iv.value_range.low_setting  = 0
+            plot_iv.value_range.high_setting = 0.1
+            plot_iv.legend.visible = True
+            plot_iv.legend.align = "ul"
+            self._plot_iv = plot_iv
+        return self._plot_iv
+
     @property
     def zout(self):
         "The driver impedance."
@@ -12,6 +12,7 @@ Copyright (c) 2019 by David Banas; All rights reserved World wide.
 """
 
 import re
+import sys
 from parsec import  regex, eof, many1, many, string, generate, sepBy1, \
                     one_of, skip, none_of, times, ParseError, count, \
                     separated, letter, digit, optional
@@ -249,7 +250,7 @@ def model():
     if DBG:
         print("    ", nm)
     res = yield many1(node(Model_keywords, IBIS_keywords, debug=DBG))
-    return {nm: Model(dict(res))}
+    return {sys.intern(nm): Model(dict(res))}
 
 # [Component]
 rlc = lexeme(string("R_pin") | string("L_pin") | string("C_pin"))
@@ -274,7 +275,8 @@ def pin(rlcs):
         rlc_dict  = {}
         if rlcs:
             rlc_dict.update(dict(zip(rlcs, rlc_vals)))
-        return ((nm + "(" + sig + ")"), (mod, rlc_dict))
+        # Interned, since these names get used as dictionary keys and ``Enum`` trait values.
+        return (sys.intern(nm + "(" + sig + ")"), (sys.intern(mod), rlc_dict))
     return fn
 
 @generate("[Component].[Pin]")
@@ -310,8 +312,8 @@ def comp():
 def modsel():
     "Parse [Model Selector]."
     nm = yield name
-    res = yield many1(name + rest_line)
-    return {nm: res}
+    res = yield many1(name.parsecmap(sys.intern) + rest_line)
+    return {sys.intern(nm): res}
 
 # Note: The following list MUST have a complete set of keys,
 #       in order for the parsing logic to work correctly!
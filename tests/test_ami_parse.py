@@ -66,6 +66,20 @@ class TestAMIParse():
         assert error_string == ""
         assert param_defs["example_tx"]["description"] == "Example Tx model from ibisami package."
 
+    def test_parse_ami_param_defs_cached(self, test_ami_config):
+        ami_parse.parse_ami_param_defs.cache_clear()
+        _, first = ami_parse.parse_ami_param_defs(test_ami_config)
+        first["example_tx"]["description"] = "Mangled by caller."
+        _, second = ami_parse.parse_ami_param_defs(test_ami_config)
+        assert ami_parse.parse_ami_param_defs.cache_info().hits == 1
+        assert second["example_tx"]["description"] == "Example Tx model from ibisami package."
+
+    def test_ami_defs_back_to_back(self):
+        first = ami_parse.ami_defs.parse("(model_a (Description \"A\"))")
+        second = ami_parse.ami_defs.parse("(model_b (Description \"B\") (Reserved_Parameters 1))")
+        assert first == ("model_a", [("Description", ['"A"'])])
+        assert second == ("model_b", [("Description", ['"B"']), ("Reserved_Parameters", ["1"])])
+
     def test_AMIParamConfigurator_without_GUI(self, test_ami_config):
         ami = ami_parse.AMIParamConfigurator(test_ami_config)
         assert ami._root_name == "example_tx"
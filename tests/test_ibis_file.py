@@ -0,0 +1,120 @@
+from pathlib import Path
+from unittest.mock import patch
+
+import pytest
+
+import pyibisami.ibis_file as ibis_file
+
+
+TWO_COMPONENTS_IBS = Path(__file__).parent.joinpath("examples", "two_components.ibs")
+
+
+@pytest.fixture
+def ibis_model_factory():
+    """Build ``IBISModel``s (by default, from the two component example), as if on 64-bit Linux, with pop-ups suppressed."""
+    with patch.object(ibis_file, "message"), patch.object(ibis_file, "_HOST_KEY", ("linux", 64)):
+        yield lambda is_tx, ibis_file_name=TWO_COMPONENTS_IBS: ibis_file.IBISModel(ibis_file_name, is_tx)
+
+
+class TestIBISModel(object):
+    def test_tx_selections(self, ibis_model_factory):
+        ibis = ibis_model_factory(True)
+        assert ibis.comp == "TESTCOMP"
+        assert ibis.pins == ["1(TXP)"]
+        assert ibis.pin_ == ("txmod", {})
+        assert ibis.models == ["txmod"]
+        assert ibis.mod == "txmod"
+        assert ibis.model is ibis.model_dict["models"]["txmod"]
+        assert ibis._dll_file == "tx64.so"
+
+        # Same first pin name, but a different model, in the new component.
+        ibis.comp = "COMP2"
+        assert ibis.pins == ["1(TXP)", "A2(TX3)"]
+        assert ibis.pin == "1(TXP)"
+        assert ibis.pin_ == ("txmod2", {})
+        assert ibis.models == ["txmod2"]
+        assert ibis.mod == "txmod2"
+        assert ibis.model is ibis.model_dict["models"]["txmod2"]
+        assert (ibis._dll_file, ibis._ami_file) == ("tx2_64.so", "tx2.ami")
+
+        ibis.pin = "A2(TX3)"
+        assert ibis.pin_ == ("txmod", {})
+        assert ibis.models == ["txmod"]
+        assert ibis.model is ibis.model_dict["models"]["txmod"]
+        assert (ibis._dll_file, ibis._ami_file) == ("tx64.so", "tx.ami")
+
+        ibis.comp = "TESTCOMP"
+        assert ibis.pins == ["1(TXP)"]
+        assert ibis.pin_ == ("txmod", {})
+        assert ibis.mod == "txmod"
+        assert ibis._dll_file == "tx64.so"
+
+    def test_rx_selections(self, ibis_model_factory):
+        ibis = ibis_model_factory(False)
+        assert ibis.pins == ["2(RXP)"]
+        assert ibis.pin_ == ("rxsel", {})
+        assert ibis.models == ["rxmod", "rxmod2"]
+        assert ibis.mod == "rxmod"
+        assert ibis.model is ibis.model_dict["models"]["rxmod"]
+        assert ibis._dll_file == ""
+
+        ibis.mod = "rxmod2"
+        assert ibis.model is ibis.model_dict["models"]["rxmod2"]
+
+        ibis.comp = "COMP2"
+        assert ibis.pins == ["A3(RX2)"]
+        assert ibis.pin == "A3(RX2)"
+        assert ibis.pin_ == ("rxmod2", {})
+        assert ibis.models == ["rxmod2"]
+        assert ibis.mod == "rxmod2"
+        assert ibis.model is ibis.model_dict["models"]["rxmod2"]
+        assert ibis._dll_file == ""
+
+    def test_bad_model_in_unselected_component(self, ibis_model_factory, tmp_path):
+        ibis_file_name = tmp_path / "bad_comp2.ibs"
+        ibis_file_name.write_text(TWO_COMPONENTS_IBS.read_text().replace("A3     RX2          rxmod2", "A3     RX2          nosuch"))
+        ibis = ibis_model_factory(True, ibis_file_name)
+        assert ibis.pins == ["1(TXP)"]
+        assert ibis.mod == "txmod"
+
+        # The undefined model only matters once its component is selected.
+        ibis.trait_setq(comp="COMP2")
+        with pytest.raises(KeyError, match="nosuch"):
+            ibis.get_pins()
+
+    def test_get_models_returns_a_copy(self, ibis_model_factory):
+        ibis = ibis_model_factory(False)
+        models = ibis.get_models("rxsel")
+        models.append("bogus")
+        assert ibis.get_models("rxsel") == ["rxmod", "rxmod2"]
+
+    def test_zout_at_vmeas(self, ibis_model_factory):
+        ibis = ibis_model_factory(True)
+        assert ibis.model._vmeas == 0.5
+        assert ibis.model.zout == pytest.approx(50.0)
+
+    def test_zout_without_vmeas(self, ibis_model_factory, tmp_path):
+        ibis_file_name = tmp_path / "no_vmeas.ibs"
+        ibis_file_name.write_text(TWO_COMPONENTS_IBS.read_text().replace("Vmeas = 0.5\n", "", 1))
+        ibis = ibis_model_factory(True, ibis_file_name)
+        assert ibis.model._vmeas is None
+        assert ibis.model.zout == pytest.approx(50.0)  # Taken at half the top of the I-V sweep.
+
+    def test_descending_iv_data(self, ibis_model_factory, tmp_path):
+        ibis_file_name = tmp_path / "descending_iv.ibs"
+        ibis_file_name.write_text(
+            TWO_COMPONENTS_IBS.read_text().replace(
+                "0.5   0.01   0.009  0.011\n1.0   0.02   0.018  0.022\n",
+                "1.0   0.02   0.018  0.022\n0.5   0.01   0.009  0.011\n",
+                1,
+            )
+        )
+        with pytest.raises(ValueError, match="ascending"):
+            ibis_model_factory(True, ibis_file_name)
+
+    def test_plot_iv_built_once(self, ibis_model_factory):
+        ibis = ibis_model_factory(True)
+        plot_iv = ibis.model.plot_iv
+        assert plot_iv is ibis.model.plot_iv
+        assert len(plot_iv.plots) == 6  # Pull-down & pull-up, each at Typ/Min/Max.
+        assert ibis.model_dict["models"]["rxmod"].plot_iv is None